@@ -0,0 +1,78 @@
+"""Benchmark for the reloadable content indexes.
+
+Measures how long a reload of the FAQ keywords, complaint templates and
+tenant files takes, and compares per-query topic lookup through the compiled
+keyword index against the original linear keyword scan.
+
+Usage:
+    python benchmarks/bench_content.py
+"""
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from custom_agents.content import CONTENT_DIR, complaint_responses, faq_keywords, find_data_file, load_data_file
+from custom_agents.tenants import tenant_registry
+
+QUERIES = [
+    "What time do you close tonight?",
+    "Tell me everything about your menu options",
+    "Do you have outdoor seating because of COVID?",
+    "Is there parking near the restaurant?",
+    "Can I book a table for a party of 10?",
+    "Do you deliver with DoorDash or UberEats?",
+    "I have a nut allergy, is that ok?",
+    "What's the happy hour deal?",
+    "Hello there",
+    "I'd like to speak to someone about a private event for my anniversary next month",
+]
+
+
+def linear_match(mapping, query):
+    """The original lookup: first keyword (in mapping order) contained in the query."""
+    for keyword, topic in mapping.items():
+        if keyword in query:
+            return topic
+    return None
+
+
+def time_per_call(fn, repeat=20000):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def time_reload(content, repeat=50):
+    samples = []
+    for _ in range(repeat):
+        content._snapshot = None
+        start = time.perf_counter()
+        content.reload()
+        samples.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(samples)
+
+
+def main():
+    mapping = load_data_file(find_data_file(CONTENT_DIR, "faq_keywords"))
+    index = faq_keywords.get()
+    queries = [q.lower() for q in QUERIES]
+
+    for query in queries:
+        assert index.match(query) == linear_match(mapping, query), query
+
+    print("Reload cost (median ms)")
+    for content in (faq_keywords, complaint_responses, tenant_registry):
+        print(f"  {content.name:<22} {time_reload(content):8.3f}")
+
+    print("Per-query topic lookup (µs)")
+    print(f"  {'linear scan':<22} {time_per_call(lambda: [linear_match(mapping, q) for q in queries]) / len(queries):8.3f}")
+    print(f"  {'compiled index':<22} {time_per_call(lambda: [faq_keywords.get().match(q) for q in queries]) / len(queries):8.3f}")
+    print(f"  {'snapshot read only':<22} {time_per_call(faq_keywords.get):8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Memory benchmark for idle chat sessions.
+
+Builds N sessions with a typical multi-turn history (user messages, handoff
+and tool calls, tool outputs, assistant replies) and reports bytes per
+session for the plain list-of-dicts history, an active SessionRecord, a
+packed (compressed) idle record and an evicted record.
+
+Usage:
+    python benchmarks/bench_sessions.py [N ...]    # default: 10000 50000
+"""
+import json
+import shutil
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from custom_agents.session_store import SessionRegistry
+
+TURNS = [
+    ("What time do you close tonight?", "DynamicFAQAgent", "answer_faq",
+     "Monday to Friday: 10 AM to 11 PM. Saturday and Sunday: 9 AM to 12 AM."),
+    ("Where is my order 67890?", "OrderAgent", "track_delivery",
+     "Driver Michael is currently 2 blocks away. Expected arrival in 8 minutes. Driver contact: 555-0123"),
+    ("The soup was cold and the waiter was rude", "ComplaintAgent", "handle_complaint",
+     "We're truly sorry about the service you received. This is not representative of our standards."),
+]
+
+
+def make_history(session: int):
+    """A fresh history, built the way json/to_input_list() would (no shared strings)."""
+    items = []
+    for turn, (user, agent, tool, output) in enumerate(TURNS):
+        call = f"call_{session}_{turn}"
+        items += [
+            {"role": "user", "content": f"{user} (session {session})"},
+            {"type": "function_call", "call_id": f"{call}_h", "name": f"transfer_to_{agent.lower()}", "arguments": "{}", "id": f"{call}_h", "status": "completed"},
+            {"type": "function_call_output", "call_id": f"{call}_h", "output": json.dumps({"assistant": agent})},
+            {"type": "function_call", "call_id": call, "name": tool, "arguments": json.dumps({"query": user}), "id": call, "status": "completed"},
+            {"type": "function_call_output", "call_id": call, "output": output},
+            {"id": f"msg_{call}", "type": "message", "role": "assistant", "status": "completed",
+             "content": [{"type": "output_text", "text": output, "annotations": []}]},
+        ]
+    return json.loads(json.dumps(items))
+
+
+def measure(label, n, build):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    used = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    print(f"  {label:<28} {used / n:10.0f} bytes/session")
+    return kept
+
+
+def main(sizes):
+    for n in sizes:
+        print(f"{n} idle sessions")
+        measure("list of dicts (before)", n, lambda: {f"s{i}": make_history(i) for i in range(n)})
+
+        store = Path(tempfile.mkdtemp())
+        try:
+            def registry(pack_after, evict_after):
+                sessions = SessionRegistry(store=store, pack_after_seconds=pack_after, evict_after_seconds=evict_after)
+                for i in range(n):
+                    sessions.open(f"s{i}", "abc").set_history(make_history(i))
+                sessions.sweep()
+                return sessions
+
+            never = float("inf")
+            measure("SessionRecord, active", n, lambda: registry(never, never))
+            measure("SessionRecord, packed", n, lambda: registry(0, never))
+            measure("SessionRecord, evicted", n, lambda: registry(0, 0))
+        finally:
+            shutil.rmtree(store, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10000, 50000])
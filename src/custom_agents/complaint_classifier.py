@@ -0,0 +1,186 @@
+import json
+import re
+import sys
+from dataclasses import asdict, dataclass, replace
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from custom_agents.content import CONTENT_DIR, ReloadableContent, find_data_file, load_data_file
+from custom_agents.tenants import DEFAULT_TENANT_ID
+
+_WORD = re.compile(r"[a-z']+")
+
+# Bit flags for the cues a term can signal
+REFUND = 1
+SLOW_SERVICE = 2
+MANAGER = 4
+_CUE_FLAGS = {"refund": REFUND, "slow_service": SLOW_SERVICE, "manager": MANAGER}
+
+
+@dataclass(frozen=True, slots=True)
+class ComplaintScore:
+    """Local pre-score of a complaint, computed without a model call.
+
+    Attributes:
+        severity: Complaint severity from 1 (minor) to 5 (severe)
+        category: Best matching category (general, food, service, cleanliness)
+        refund: The customer asks for a refund or their money back
+        slow_service: The complaint is about waiting or slow service
+        wants_manager: The customer asks for a manager or to speak to someone
+        escalate: The complaint should be routed to management
+    """
+    severity: int
+    category: str
+    refund: bool
+    slow_service: bool
+    wants_manager: bool
+    escalate: bool
+
+
+@dataclass(frozen=True, slots=True)
+class ComplaintLexicon:
+    """Compiled lexicon: each term maps to (category weights, severity weight, cue flags)."""
+    categories: Tuple[str, ...]
+    terms: Mapping[str, Tuple[Tuple[Tuple[int, float], ...], float, int]]
+    exclamation_weight: float
+    max_exclamation_bonus: float
+    escalate_at: int
+
+
+def compile_lexicon(data: Dict[str, Any]) -> ComplaintLexicon:
+    """Merge the category, severity and cue word lists into one term table."""
+    categories = tuple(data["categories"])
+    category_weights: Dict[str, List[Tuple[int, float]]] = {}
+    for index, category in enumerate(categories):
+        for term, weight in data["categories"][category].items():
+            category_weights.setdefault(term, []).append((index, float(weight)))
+    cue_flags: Dict[str, int] = {}
+    for cue, terms in data.get("cues", {}).items():
+        for term in terms:
+            cue_flags[term] = cue_flags.get(term, 0) | _CUE_FLAGS[cue]
+    severity = data.get("severity", {})
+
+    terms = {}
+    for term in category_weights.keys() | severity.keys() | cue_flags.keys():
+        terms[sys.intern(term)] = (
+            tuple(category_weights.get(term, ())),
+            float(severity.get(term, 0.0)),
+            cue_flags.get(term, 0),
+        )
+    return ComplaintLexicon(
+        categories=categories,
+        terms=MappingProxyType(terms),
+        exclamation_weight=float(data.get("exclamation_weight", 0.5)),
+        max_exclamation_bonus=float(data.get("max_exclamation_bonus", 1.0)),
+        escalate_at=int(data.get("escalate_at", 4)),
+    )
+
+
+complaint_lexicon: ReloadableContent[ComplaintLexicon] = ReloadableContent(
+    "complaint_lexicon",
+    lambda: [find_data_file(CONTENT_DIR, "complaint_lexicon")],
+    lambda paths: compile_lexicon(load_data_file(paths[0])),
+)
+
+
+def score_complaint(complaint: str, lexicon: Optional[ComplaintLexicon] = None) -> ComplaintScore:
+    """Score a complaint's severity and category and detect refund/escalation cues.
+
+    Words and two-word phrases are looked up in the lexicon in a single pass
+    over the text.
+
+    Args:
+        complaint: The customer's complaint in their own words
+        lexicon: Lexicon to use, defaults to the currently loaded one
+
+    Returns:
+        The complaint's score
+    """
+    lexicon = lexicon or complaint_lexicon.get()
+    terms = lexicon.terms
+    category_totals = [0.0] * len(lexicon.categories)
+    severity = 0.0
+    cues = 0
+
+    previous = None
+    for word in _WORD.findall(complaint.lower()):
+        candidates = (word, f"{previous} {word}") if previous else (word,)
+        previous = word
+        for term in candidates:
+            entry = terms.get(term)
+            if entry is None:
+                continue
+            for index, weight in entry[0]:
+                category_totals[index] += weight
+            severity += entry[1]
+            cues |= entry[2]
+
+    severity += min(complaint.count("!") * lexicon.exclamation_weight, lexicon.max_exclamation_bonus)
+    level = max(1, min(5, 1 + int(severity + 0.5)))
+
+    best = max(range(len(category_totals)), key=category_totals.__getitem__, default=None)
+    category = lexicon.categories[best] if best is not None and category_totals[best] > 0 else "general"
+
+    wants_manager = bool(cues & MANAGER)
+    return ComplaintScore(
+        severity=level,
+        category=category,
+        refund=bool(cues & REFUND),
+        slow_service=bool(cues & SLOW_SERVICE),
+        wants_manager=wants_manager,
+        escalate=level >= lexicon.escalate_at or wants_manager,
+    )
+
+
+def with_severity(score: ComplaintScore, severity: int, lexicon: Optional[ComplaintLexicon] = None) -> ComplaintScore:
+    """Raise a score's severity (e.g. to the model's estimate) and re-derive escalation from it.
+
+    Args:
+        score: The local score
+        severity: Another severity estimate from 1 to 5; it can only raise the score's severity
+        lexicon: Lexicon holding the escalation threshold, defaults to the currently loaded one
+
+    Returns:
+        The score with the final severity and matching escalation
+    """
+    lexicon = lexicon or complaint_lexicon.get()
+    level = max(score.severity, min(5, int(severity)))
+    return replace(score, severity=level, escalate=level >= lexicon.escalate_at or score.wants_manager)
+
+
+# Called with (tenant_id, complaint, score) for every complaint routed to management
+EscalationHandler = Callable[[str, str, ComplaintScore], None]
+_escalation_handlers: List[EscalationHandler] = []
+
+
+def on_escalation(handler: EscalationHandler) -> None:
+    """Register a callback (e.g. a ticketing or paging integration) for escalated complaints."""
+    _escalation_handlers.append(handler)
+
+
+def escalate(tenant_id: str, complaint: str, score: ComplaintScore) -> None:
+    """Route an escalated complaint to management: log it and call every registered handler."""
+    # Logged to stderr so the batch scorer's JSON lines on stdout stay clean
+    print(f"[COMPLAINT_ESCALATED] tenant={tenant_id} severity={score.severity} category={score.category}", file=sys.stderr)
+    for handler in _escalation_handlers:
+        try:
+            handler(tenant_id, complaint, score)
+        except Exception as e:
+            print(f"[COMPLAINT_ESCALATION_FAILED] {handler}: {e}", file=sys.stderr)
+
+
+def score_complaints(complaints: Iterable[str]) -> List[ComplaintScore]:
+    """Score a batch of complaints (e.g. the complaint backlog) with one lexicon snapshot."""
+    lexicon = complaint_lexicon.get()
+    return [score_complaint(complaint, lexicon) for complaint in complaints]
+
+
+if __name__ == "__main__":
+    # Batch-score a backlog: one complaint per line on stdin, one JSON result per line on stdout.
+    # Escalated complaints are routed like live ones, for the tenant given as first argument.
+    tenant_id = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_TENANT_ID
+    lines = [line.strip() for line in sys.stdin if line.strip()]
+    for line, score in zip(lines, score_complaints(lines)):
+        print(json.dumps({"complaint": line, **asdict(score)}))
+        if score.escalate:
+            escalate(tenant_id, line, score)
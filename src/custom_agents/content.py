@@ -0,0 +1,154 @@
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Generic, List, Mapping, Optional, Tuple, TypeVar
+
+try:
+    import yaml
+except ImportError:  # YAML content files are optional, JSON works without it
+    yaml = None
+
+CONTENT_DIR = Path(os.getenv("CONTENT_DIR", Path(__file__).parent / "data" / "content"))
+# How often content files are checked for changes
+CONTENT_RELOAD_SECONDS = float(os.getenv("CONTENT_RELOAD_SECONDS", "2"))
+
+T = TypeVar("T")
+
+
+def load_data_file(path: Path) -> Any:
+    """Parse a JSON or YAML content file."""
+    with open(path, encoding="utf-8") as f:
+        if path.suffix in (".yaml", ".yml"):
+            if yaml is None:
+                raise RuntimeError(f"PyYAML is required to load {path}")
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+def find_data_file(directory: Path, stem: str) -> Path:
+    """Return `<stem>.json`, `<stem>.yaml` or `<stem>.yml` from a directory."""
+    for suffix in (".json", ".yaml", ".yml"):
+        path = Path(directory) / f"{stem}{suffix}"
+        if path.exists():
+            return path
+    raise FileNotFoundError(f"No content file named '{stem}' in {directory}")
+
+
+class ReloadableContent(Generic[T]):
+    """An immutable snapshot compiled from files, swapped atomically when the files change.
+
+    Readers call `get()` and keep using the snapshot they received, so a turn
+    in progress is never affected by a reload. Files are watched by a single
+    background thread shared by all reloadable content.
+    """
+
+    def __init__(self, name: str, sources: Callable[[], List[Path]], compile: Callable[[List[Path]], T]):
+        """
+        Args:
+            name: Label used in log messages
+            sources: Returns the files the content is built from
+            compile: Builds the immutable snapshot from those files
+        """
+        self.name = name
+        self.sources = sources
+        self.compile = compile
+        self._snapshot: Optional[T] = None
+        self._signature: Tuple = ()
+        self._lock = threading.Lock()
+
+    def _current_signature(self) -> Tuple:
+        return tuple((str(p), p.stat().st_mtime_ns) for p in self.sources())
+
+    def get(self) -> T:
+        """Return the current snapshot, loading it on first use."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            self.reload()
+            _watch(self)
+            snapshot = self._snapshot
+        return snapshot
+
+    def reload(self) -> bool:
+        """Rebuild the snapshot if the files changed. Returns True if it was swapped."""
+        with self._lock:
+            signature = self._current_signature()
+            if self._snapshot is not None and signature == self._signature:
+                return False
+            paths = [Path(path) for path, _ in signature]
+            try:
+                self._snapshot = self.compile(paths)
+            finally:
+                # A broken file is reported once, not on every poll, until it changes again
+                self._signature = signature
+            return True
+
+
+_watched: List[ReloadableContent] = []
+_watcher: Optional[threading.Thread] = None
+
+
+def _watch(content: ReloadableContent) -> None:
+    global _watcher
+    if content not in _watched:
+        _watched.append(content)
+    if _watcher is None and CONTENT_RELOAD_SECONDS > 0:
+        _watcher = threading.Thread(target=_watch_loop, name="content-watcher", daemon=True)
+        _watcher.start()
+
+
+def _watch_loop() -> None:
+    while True:
+        time.sleep(CONTENT_RELOAD_SECONDS)
+        for content in list(_watched):
+            try:
+                if content.reload():
+                    print(f"[CONTENT_RELOADED] {content.name}")
+            except Exception as e:
+                # Keep serving the previous snapshot if the new files are broken
+                print(f"[CONTENT_RELOAD_FAILED] {content.name}: {e}")
+
+
+@dataclass(frozen=True, slots=True)
+class KeywordIndex:
+    """Compiled keyword → FAQ topic lookup.
+
+    Keywords are kept as a flat tuple of (keyword, topic) pairs in priority
+    order; the first keyword contained in the query wins. For the short
+    queries and ~80 keywords involved, C-level substring checks over a tuple
+    beat a combined regex by several times.
+    """
+    keywords: Tuple[Tuple[str, str], ...]
+
+    def match(self, query: str) -> Optional[str]:
+        """Return the topic of the highest priority keyword in a lowercased query."""
+        for keyword, topic in self.keywords:
+            if keyword in query:
+                return topic
+        return None
+
+
+def compile_keyword_index(mapping: Dict[str, str]) -> KeywordIndex:
+    """Compile a keyword → topic mapping, keeping the mapping's order as priority."""
+    return KeywordIndex(keywords=tuple((sys.intern(k), sys.intern(t)) for k, t in mapping.items()))
+
+
+def _freeze_templates(data: Dict[str, Dict[str, str]]) -> Mapping[str, Mapping[str, str]]:
+    return MappingProxyType({k: MappingProxyType(dict(v)) for k, v in data.items()})
+
+
+faq_keywords: ReloadableContent[KeywordIndex] = ReloadableContent(
+    "faq_keywords",
+    lambda: [find_data_file(CONTENT_DIR, "faq_keywords")],
+    lambda paths: compile_keyword_index(load_data_file(paths[0])),
+)
+
+complaint_responses: ReloadableContent[Mapping[str, Mapping[str, str]]] = ReloadableContent(
+    "complaint_responses",
+    lambda: [find_data_file(CONTENT_DIR, "complaint_responses")],
+    lambda paths: _freeze_templates(load_data_file(paths[0])),
+)
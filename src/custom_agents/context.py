@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from custom_agents.tenants import Tenant, all_tenants, get_tenant
+
+
+@dataclass(slots=True)
+class SessionContext:
+    """Per-session state passed to the agents and tools as the run context.
+
+    Attributes:
+        tenant_id: The restaurant this chat session belongs to
+        session_id: The chat session's ID (used for push updates)
+        tool_cache: Memoized results of idempotent tool calls in this session
+        last_tenant: The tenant configuration this session last saw
+    """
+    tenant_id: str
+    session_id: str = ""
+    tool_cache: Dict[Tuple, Tuple[float, int, Any]] = field(default_factory=dict)
+    last_tenant: Optional[Tenant] = field(default=None, repr=False)
+
+    @property
+    def tenant(self) -> Tenant:
+        """The tenant's configuration from the latest loaded snapshot.
+
+        If a reload removed the tenant, the session keeps the configuration it
+        last saw instead of switching restaurants mid-conversation.
+        """
+        tenant = all_tenants().get(self.tenant_id)
+        if tenant is None:
+            if self.last_tenant is None:
+                self.last_tenant = get_tenant(self.tenant_id)
+            return self.last_tenant
+        self.last_tenant = tenant
+        return tenant
@@ -1,42 +1,32 @@
-from agents import function_tool
+from dataclasses import replace
+from agents import function_tool, RunContextWrapper
+from custom_agents.complaint_classifier import escalate, score_complaint, with_severity
+from custom_agents.content import complaint_responses
+from custom_agents.context import SessionContext
 
 
 @function_tool
-def handle_complaint(complaint: str, severity: int = 1, category: str = "general") -> str:
+def handle_complaint(ctx: RunContextWrapper[SessionContext], complaint: str, severity: int = 1, category: str = "general") -> str:
     """
     Processes customer complaints and generates appropriate responses.
     
     Args:
         complaint: The customer's complaint in their own words
-        severity: Complaint severity from 1 (minor) to 5 (severe)
-        category: Category of complaint (general, food, service, cleanliness, etc.)
+        severity: Complaint severity from 1 (minor) to 5 (severe), optional - scored locally if omitted
+        category: Category of complaint (general, food, service, cleanliness, etc.), optional - detected locally if omitted
         
     Returns:
         A response addressing the customer's complaint
     """
-    # Response templates based on severity and category
-    responses = {
-        "general": {
-            "low": "We appreciate your feedback. We're sorry about your experience and will look into this matter.",
-            "medium": "We sincerely apologize for your experience. Your feedback is important to us, and we'll address this issue promptly.",
-            "high": "We deeply regret your negative experience. This is not the standard we aim for. A manager will contact you directly to resolve this matter."
-        },
-        "food": {
-            "low": "We're sorry your meal wasn't up to our usual standards. We'll share your feedback with our kitchen team.",
-            "medium": "We sincerely apologize about your dining experience. We take food quality very seriously and will address this with our chef immediately.",
-            "high": "We deeply regret your unsatisfactory dining experience. This is unacceptable, and we'd like to make it right. A manager will contact you to offer a resolution."
-        },
-        "service": {
-            "low": "We apologize for the service issues you experienced. We strive to provide excellent service and will address this with our staff.",
-            "medium": "We're truly sorry about the service you received. This is not representative of our standards, and we'll be reviewing this with our team.",
-            "high": "We're deeply concerned about the service you received. This falls well below our standards. Our manager will contact you directly to resolve this matter."
-        },
-        "cleanliness": {
-            "low": "Thank you for bringing this cleanliness issue to our attention. We'll address it right away.",
-            "medium": "We sincerely apologize for the cleanliness issues you encountered. This is not our standard, and we'll implement immediate corrective measures.",
-            "high": "We're deeply sorry about the cleanliness issues you experienced. This is completely unacceptable. Our management team will investigate immediately and contact you with a resolution."
-        }
-    }
+    # Response templates based on severity and category (loaded from the content files)
+    responses = complaint_responses.get()
+    
+    # Pre-score the complaint locally; the model's estimate can only raise the severity,
+    # and escalation follows the final severity
+    score = with_severity(score_complaint(complaint), severity)
+    severity = score.severity
+    if category == "general" or category not in responses:
+        category = score.category
     
     # Set severity level
     if severity <= 2:
@@ -53,14 +43,17 @@ def handle_complaint(complaint: str, severity: int = 1, category: str = "general
     # Generate response based on complaint analysis
     base_response = responses[category][level]
     
-    # Add personalized elements based on complaint content
-    if "refund" in complaint.lower() or "money back" in complaint.lower():
-        base_response += " Please contact our customer service team at 555-1234 to discuss refund options."
+    # Add personalized elements based on the detected cues
+    if score.refund:
+        base_response += f" Please contact our customer service team at {ctx.context.tenant.phone} to discuss refund options."
     
-    if "wait" in complaint.lower() or "slow" in complaint.lower():
+    if score.slow_service:
         base_response += " We're reviewing our processes to improve our service times."
     
-    if "manager" in complaint.lower() or "speak" in complaint.lower():
+    # Escalation is decided by the final score (the "high" templates already promise a manager)
+    if score.wants_manager or (score.escalate and level != "high"):
         base_response += " A manager will reach out to you within 24 hours."
+    if score.escalate:
+        escalate(ctx.context.tenant_id, complaint, replace(score, category=category))
     
     return base_response
\ No newline at end of file
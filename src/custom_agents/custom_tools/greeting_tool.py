@@ -1,6 +1,8 @@
-from agents import function_tool
+from agents import function_tool, RunContextWrapper
+from custom_agents.context import SessionContext
 @function_tool
 def greet_customer(
+    ctx: RunContextWrapper[SessionContext],
     name: str = "",
     time_of_day: str = "",
     is_returning: bool = False,
@@ -8,7 +10,7 @@ def greet_customer(
     special_occasion: str = ""
 ) -> str:
     """
-    Generates a personalized greeting for customers at ABC Restaurant.
+    Generates a personalized greeting for customers at the restaurant.
     
     Args:
         name: Customer's name (if available)
@@ -21,7 +23,7 @@ def greet_customer(
         A personalized greeting message
     """
     # Base greeting components
-    restaurant_name = "ABC Restaurant"
+    restaurant_name = ctx.context.tenant.name
     
     # Time-based greeting
     if not time_of_day:
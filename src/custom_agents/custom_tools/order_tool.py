@@ -1,7 +1,12 @@
-from agents import function_tool
-from typing import Dict, List, Optional, Any
+from agents import function_tool, RunContextWrapper
+from typing import Optional
+from custom_agents.context import SessionContext
+from custom_agents.delivery_watcher import delivery_watcher
+from custom_agents.order_store import FINAL_STATUSES, describe_order, describe_tracking, get_order_store
+from custom_agents.tool_cache import idempotent
 @function_tool
-def check_order_status(order_id: str):
+@idempotent(entity="order", id_arg="order_id")
+def check_order_status(ctx: RunContextWrapper[SessionContext], order_id: str):
     """Check the status of an order with the given order ID.
     
     Args:
@@ -10,63 +15,18 @@ def check_order_status(order_id: str):
     Returns:
         str: Status message with details about the order
     """
-    # Expanded database with more orders and detailed status information
-    order_statuses: Dict[str, Dict[str, Any]] = {
-        "12345": {
-            "status": "preparing",
-            "eta_minutes": 20,
-            "items": ["Pizza Margherita", "Garlic Bread"],
-            "last_update": "2025-03-19T14:30:00"
-        },
-        "67890": {
-            "status": "dispatched",
-            "eta_minutes": 10,
-            "items": ["Chicken Burger", "Fries", "Soda"],
-            "last_update": "2025-03-19T14:35:00"
-        },
-        "11121": {
-            "status": "processing",
-            "eta_minutes": 30,
-            "items": ["Pasta Carbonara", "Tiramisu"],
-            "last_update": "2025-03-19T14:25:00"
-        },
-        "22222": {
-            "status": "delivered",
-            "delivery_time": "2025-03-19T14:00:00",
-            "items": ["Vegetable Soup", "Caesar Salad"],
-            "last_update": "2025-03-19T14:05:00"
-        },
-        "33333": {
-            "status": "cancelled",
-            "reason": "Customer request",
-            "items": ["Sushi Platter"],
-            "last_update": "2025-03-19T13:45:00"
-        }
-    }
-
+    # Live orders belonging to the session's restaurant
+    order = get_order_store(ctx.context.tenant_id).get(order_id)
     
-    if order_id not in order_statuses:
+    if order is None:
         return "Order ID not found. Please check and try again."
     
-    order = order_statuses[order_id]
-    
     # Format response based on status
-    if order["status"] == "preparing":
-        return f"Your order {order_id} is being prepared and will be delivered in {order['eta_minutes']} minutes. Items: {', '.join(order['items'])}."
-    elif order["status"] == "dispatched":
-        return f"Your order {order_id} has been dispatched and will arrive in {order['eta_minutes']} minutes. Items: {', '.join(order['items'])}."
-    elif order["status"] == "processing":
-        return f"Your order {order_id} is still being processed. Estimated delivery in {order['eta_minutes']} minutes. Items: {', '.join(order['items'])}."
-    elif order["status"] == "delivered":
-        return f"Your order {order_id} was delivered at {order['delivery_time']}. Items: {', '.join(order['items'])}."
-    elif order["status"] == "cancelled":
-        return f"Your order {order_id} was cancelled. Reason: {order['reason']}. Items: {', '.join(order['items'])}."
-    else:
-        return f"Your order {order_id} status: {order['status']}. Please contact customer service for more information."
+    return describe_order(order_id, order)
 
 
 @function_tool
-def track_delivery(order_id: str):
+def track_delivery(ctx: RunContextWrapper[SessionContext], order_id: str):
     """Get real-time tracking information for a dispatched order.
     
     Args:
@@ -75,31 +35,41 @@ def track_delivery(order_id: str):
     Returns:
         str: Tracking details with location and ETA
     """
-    # Simulated delivery tracking data
-    tracking_info = {
-        "67890": {
-            "driver_name": "Michael",
-            "current_location": "2 blocks away",
-            "eta_minutes": 8,
-            "contact": "555-0123"
-        },
-        "12345": {
-            "driver_name": "Sarah",
-            "current_location": "In the kitchen",
-            "eta_minutes": 18,
-            "contact": "555-0124"
-        }
-    }
+    order = get_order_store(ctx.context.tenant_id).get(order_id)
+    
+    if order is None:
+        return "Order ID not found. Please check and try again."
     
-    if order_id not in tracking_info:
+    # Delivered or cancelled orders have no live delivery, whatever tracking data is left
+    if order["status"] in FINAL_STATUSES:
+        return describe_order(order_id, order)
+    
+    # Delivery tracking data for the session's restaurant
+    tracking = _lookup_tracking(ctx, order_id)
+    
+    # Push further updates to this chat instead of having the customer ask again,
+    # including for orders that haven't been dispatched yet
+    subscribed = delivery_watcher.subscribe(ctx.context.tenant_id, order_id, ctx.context.session_id)
+    
+    if tracking is None:
+        if subscribed:
+            return f"Tracking information is not available yet for order {order_id}. I'll post an update here automatically as soon as its status changes."
         return "Tracking information not available for this order. Either the order hasn't been dispatched yet or tracking is not supported."
     
-    info = tracking_info[order_id]
-    return f"Driver {info['driver_name']} is currently {info['current_location']}. Expected arrival in {info['eta_minutes']} minutes. Driver contact: {info['contact']}"
+    if subscribed:
+        return f"{tracking}. I'll post updates here automatically as your delivery progresses."
+    return tracking
+
+
+@idempotent(entity="order", id_arg="order_id")
+def _lookup_tracking(ctx: RunContextWrapper[SessionContext], order_id: str) -> Optional[str]:
+    """Memoized tracking lookup, kept apart from track_delivery's subscription side effect."""
+    info = get_order_store(ctx.context.tenant_id).tracking(order_id)
+    return describe_tracking(info) if info is not None else None
 
 
 @function_tool
-def update_order(order_id: str, update_type: str, details: str = None):
+def update_order(ctx: RunContextWrapper[SessionContext], order_id: str, update_type: str, details: str = None):
     """Modify an existing order if it hasn't been dispatched.
     
     Args:
@@ -110,19 +80,25 @@ def update_order(order_id: str, update_type: str, details: str = None):
     Returns:
         str: Confirmation message or error
     """
-    # Simulated order update logic
-    modifiable_orders = ["11121", "12345"]
+    # Orders can be modified until they are dispatched
+    modifiable_orders = ctx.context.tenant.modifiable_orders
+    store = get_order_store(ctx.context.tenant_id)
+    order = store.get(order_id)
     
-    if order_id not in modifiable_orders:
+    if order_id not in modifiable_orders or order is None or order["status"] in FINAL_STATUSES:
         return "This order cannot be modified. It may have already been dispatched or delivered."
     
     if update_type == "cancel":
+        store.update(order_id, status="cancelled", reason="Customer request")
         return f"Order {order_id} has been cancelled successfully."
     elif update_type == "add_item":
+        store.update(order_id, items=list(order["items"]) + [details])
         return f"Added '{details}' to order {order_id}."
     elif update_type == "remove_item":
+        store.update(order_id, items=[item for item in order["items"] if item != details])
         return f"Removed '{details}' from order {order_id}."
     elif update_type == "change_address":
+        store.update(order_id, address=details)
         return f"Delivery address for order {order_id} updated to: {details}"
     else:
         return "Invalid update type. Supported types: add_item, remove_item, change_address, cancel"
\ No newline at end of file
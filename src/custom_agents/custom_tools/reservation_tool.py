@@ -1,6 +1,12 @@
-from agents import function_tool
+from agents import function_tool, RunContextWrapper
+from custom_agents.context import SessionContext
+from custom_agents.tool_cache import idempotent, tool_cache
+# Only lookups are memoized; bookings, changes and cancellations always run
 @function_tool
+@idempotent(entity="reservation", id_arg="reservation_id",
+            only_if=lambda args: args["request_type"].lower() in ("check", "availability"))
 def handle_reservation(
+    ctx: RunContextWrapper[SessionContext],
     request_type: str,
     party_size: int = 2,
     date: str = "",
@@ -12,7 +18,7 @@ def handle_reservation(
     reservation_id: str = ""
 ) -> str:
     """
-    Handles various reservation-related requests for ABC Restaurant.
+    Handles various reservation-related requests for the restaurant.
     
     Args:
         request_type: Type of reservation request (make, modify, cancel, availability)
@@ -30,10 +36,19 @@ def handle_reservation(
     """
     import datetime
     
+    tenant = ctx.context.tenant
+    restaurant_phone = tenant.phone
+    restaurant_name = tenant.name
+    
     # Validate request type
     valid_request_types = ["make", "modify", "cancel", "availability", "check"]
     if request_type.lower() not in valid_request_types:
-        return "I'm not sure about that request. Please call us at 555-1234 for assistance with your reservation."
+        return f"I'm not sure about that request. Please call us at {restaurant_phone} for assistance with your reservation."
+    
+    # Writes make cached lookups of this reservation and of availability stale
+    if request_type.lower() in ["make", "modify", "cancel"]:
+        tool_cache.invalidate(tenant.tenant_id, "reservation", reservation_id)
+        tool_cache.invalidate(tenant.tenant_id, "reservation", "")
     
     # Current date/time for realistic responses
     current_date = datetime.datetime.now().strftime("%Y-%m-%d")
@@ -73,19 +88,19 @@ def handle_reservation(
         
         # Check if restaurant can accommodate based on party size
         if party_size > 12:
-            return f"For parties larger than 12, please call us directly at 555-1234 to discuss private dining options."
+            return f"For parties larger than 12, please call us directly at {restaurant_phone} to discuss private dining options."
         
         # Generate different responses based on timing and party size
         if is_large_party:
-            return f"Thank you, {name}. Your reservation request for {party_size} guests on {date} at {time} has been received (Ref: {reservation_id}). For parties of more than 6, we require a credit card to hold the reservation. Please call us at 555-1234 to complete your booking, or check your email for a secure payment link."
+            return f"Thank you, {name}. Your reservation request for {party_size} guests on {date} at {time} has been received (Ref: {reservation_id}). For parties of more than 6, we require a credit card to hold the reservation. Please call us at {restaurant_phone} to complete your booking, or check your email for a secure payment link."
         
         # Weekend-specific messaging
         if is_weekend:
-            return f"Thank you, {name}. Your reservation for {party_size} guests on {date} at {time} is confirmed (Ref: {reservation_id}). Weekend reservations are in high demand, so please call us at 555-1234 if you need to change or cancel. We look forward to serving you at ABC Restaurant!"
+            return f"Thank you, {name}. Your reservation for {party_size} guests on {date} at {time} is confirmed (Ref: {reservation_id}). Weekend reservations are in high demand, so please call us at {restaurant_phone} if you need to change or cancel. We look forward to serving you at {restaurant_name}!"
         
         # Standard confirmation
         special_note = f" We've noted your request: '{special_requests}'." if special_requests else ""
-        return f"Thank you, {name}. Your reservation for {party_size} guests on {date} at {time} is confirmed (Ref: {reservation_id}).{special_note} A confirmation has been sent to {email or 'your contact information'}. We look forward to welcoming you to ABC Restaurant!"
+        return f"Thank you, {name}. Your reservation for {party_size} guests on {date} at {time} is confirmed (Ref: {reservation_id}).{special_note} A confirmation has been sent to {email or 'your contact information'}. We look forward to welcoming you to {restaurant_name}!"
     
     elif request_type.lower() == "modify":
         # Check for reservation ID
@@ -103,7 +118,7 @@ def handle_reservation(
             return f"Your reservation ({reservation_id}) modification request has been received, but no changes were specified. Please indicate what you'd like to change."
         
         changes_text = ", ".join(changes)
-        return f"Your request to modify reservation {reservation_id} has been received. We'll update your reservation with the following changes: {changes_text}. Please check your email shortly for confirmation of these changes. If you don't receive it within 15 minutes, please call us at 555-1234."
+        return f"Your request to modify reservation {reservation_id} has been received. We'll update your reservation with the following changes: {changes_text}. Please check your email shortly for confirmation of these changes. If you don't receive it within 15 minutes, please call us at {restaurant_phone}."
     
     elif request_type.lower() == "cancel":
         # Check for reservation ID
@@ -111,7 +126,7 @@ def handle_reservation(
             return "To cancel a reservation, we need your reservation reference number. Please provide this information."
         
         # Generate cancellation response
-        return f"Your reservation ({reservation_id}) has been canceled successfully. If this was a mistake, please call us at 555-1234 within the next hour to reinstate your reservation. We hope to welcome you to ABC Restaurant another time!"
+        return f"Your reservation ({reservation_id}) has been canceled successfully. If this was a mistake, please call us at {restaurant_phone} within the next hour to reinstate your reservation. We hope to welcome you to {restaurant_name} another time!"
     
     elif request_type.lower() == "check":
         # Check for reservation ID
@@ -153,7 +168,7 @@ def handle_reservation(
         available_lunch = ", ".join(lunch_slots)
         available_dinner = ", ".join(dinner_slots)
         
-        return f"For {date}, we have the following availability: \n\nLunch: {available_lunch}\nDinner: {available_dinner}\n\n{large_party_msg}{busy_message}\n\nTo make a reservation, please reply with 'make' and your preferred time, or call us at 555-1234."
+        return f"For {date}, we have the following availability: \n\nLunch: {available_lunch}\nDinner: {available_dinner}\n\n{large_party_msg}{busy_message}\n\nTo make a reservation, please reply with 'make' and your preferred time, or call us at {restaurant_phone}."
     
     # Fallback response
-    return "I'm not sure about that request. Please call us at 555-1234 for assistance with your reservation."
\ No newline at end of file
+    return f"I'm not sure about that request. Please call us at {restaurant_phone} for assistance with your reservation."
\ No newline at end of file
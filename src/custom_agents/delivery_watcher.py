@@ -0,0 +1,121 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from custom_agents.order_store import FINAL_STATUSES, describe_order, describe_tracking, get_order_store, on_order_change
+
+# Pushes a message to one chat session
+Sender = Callable[[str], Awaitable[None]]
+
+
+class DeliveryWatcher:
+    """Fans order changes out to every chat session tracking that order.
+
+    A single background task serves all subscribers: each change is formatted
+    once and pushed directly to the sessions, without any model calls.
+    """
+
+    def __init__(self):
+        self._senders: Dict[str, Sender] = {}
+        self._subscribers: Dict[Tuple[str, str], Set[str]] = {}
+        self._changes: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the watcher task on the running event loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._loop = asyncio.get_running_loop()
+            self._changes = asyncio.Queue()
+            self._task = self._loop.create_task(self._run())
+
+    def register_session(self, session_id: str, send: Sender) -> None:
+        """Make a chat session reachable for push updates."""
+        self._senders[session_id] = send
+
+    def unregister_session(self, session_id: str) -> None:
+        """Forget a session and drop all of its subscriptions."""
+        self._senders.pop(session_id, None)
+        for key in [key for key, sessions in self._subscribers.items() if session_id in sessions]:
+            self._unsubscribe(key, session_id)
+
+    def subscribe(self, tenant_id: str, order_id: str, session_id: str) -> bool:
+        """Push future updates of an order to a session. Returns False if the session can't receive pushes."""
+        if session_id not in self._senders:
+            return False
+        self._subscribers.setdefault((tenant_id, order_id), set()).add(session_id)
+        return True
+
+    def subscriber_count(self) -> int:
+        """Number of (order, session) subscriptions."""
+        return sum(len(sessions) for sessions in self._subscribers.values())
+
+    def _unsubscribe(self, key: Tuple[str, str], session_id: str) -> None:
+        sessions = self._subscribers.get(key)
+        if sessions is not None:
+            sessions.discard(session_id)
+            if not sessions:
+                del self._subscribers[key]
+
+    def notify(self, tenant_id: str, order_id: str, kind: str = "order") -> None:
+        """Queue a change ("order" or "tracking") for fan-out. Safe to call from any thread."""
+        key = (tenant_id, order_id)
+        if self._loop is None or key not in self._subscribers:
+            return
+        change = (key, kind)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._changes.put_nowait(change)
+        else:
+            self._loop.call_soon_threadsafe(self._changes.put_nowait, change)
+
+    async def _run(self) -> None:
+        while True:
+            changes = [await self._changes.get()]
+            # Coalesce bursts of changes to the same order into one push
+            while not self._changes.empty():
+                changes.append(self._changes.get_nowait())
+            pending: Dict[Tuple[str, str], Set[str]] = {}
+            for key, kind in changes:
+                pending.setdefault(key, set()).add(kind)
+            for (tenant_id, order_id), kinds in pending.items():
+                await self._push(tenant_id, order_id, kinds)
+
+    async def _push(self, tenant_id: str, order_id: str, kinds: Set[str]) -> None:
+        sessions = self._subscribers.get((tenant_id, order_id))
+        if not sessions:
+            return
+        store = get_order_store(tenant_id)
+        order = store.get(order_id)
+        if order is None:
+            return
+        # Only report what changed: stored tracking data may predate a status
+        # change and would contradict its ETA
+        parts = []
+        if "order" in kinds:
+            parts.append(describe_order(order_id, order))
+        tracking = store.tracking(order_id)
+        if "tracking" in kinds and tracking and order.get("status") not in FINAL_STATUSES:
+            parts.append(describe_tracking(tracking))
+        if not parts:
+            return
+        content = f"Update: {' '.join(parts)}"
+
+        session_ids = [s for s in sessions if s in self._senders]
+        results = await asyncio.gather(
+            *(self._senders[s](content) for s in session_ids),
+            return_exceptions=True,
+        )
+        for session_id, result in zip(session_ids, results):
+            if isinstance(result, Exception):
+                print(f"[DELIVERY_PUSH_FAILED] {session_id}: {result}")
+
+        # Nothing more to report once the order is finished
+        if order.get("status") in FINAL_STATUSES:
+            self._subscribers.pop((tenant_id, order_id), None)
+
+
+delivery_watcher = DeliveryWatcher()
+on_order_change(delivery_watcher.notify)
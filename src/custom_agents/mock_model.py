@@ -0,0 +1,170 @@
+import json
+import re
+import time
+from itertools import count
+from typing import Any, Dict, List
+
+from agents.items import ModelResponse
+from agents.models.interface import Model
+from agents.usage import Usage
+from openai.types.responses import (
+    Response,
+    ResponseCompletedEvent,
+    ResponseFunctionToolCall,
+    ResponseOutputMessage,
+    ResponseOutputText,
+    ResponseUsage,
+)
+from openai.types.responses.response_usage import OutputTokensDetails
+
+from custom_agents.rate_limiter import estimate_tokens
+
+# Keywords the mock triage uses to pick a specialist agent, checked in order
+ROUTES = (
+    ("ComplaintAgent", ("complain", "terrible", "awful", "worst", "rude", "dirty", "refund", "disgusting", "unacceptable")),
+    ("OrderAgent", ("order", "track", "deliver", "driver", "where is my")),
+    ("ReservationAgent", ("reserv", "book", "table for", "cancel my reservation", "availability")),
+    ("GreetingAgent", ("hello", " hi ", "hey", "good morning", "good evening", "good afternoon")),
+)
+FALLBACK_ROUTE = "DynamicFAQAgent"
+
+_ORDER_ID = re.compile(r"\b\d{5}\b")
+_DATE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
+_TIME = re.compile(r"\b\d{1,2}:\d{2}\b")
+_PARTY_SIZE = re.compile(r"\bfor (\d+)\b")
+
+
+def _item(item: Any, key: str) -> Any:
+    return item.get(key) if isinstance(item, dict) else getattr(item, key, None)
+
+
+def _last_user_message(items: List[Any]) -> str:
+    for item in reversed(items):
+        if _item(item, "role") == "user":
+            content = _item(item, "content")
+            return content if isinstance(content, str) else json.dumps(content)
+    return ""
+
+
+class MockModel(Model):
+    """Deterministic stand-in for the LLM used to replay conversations offline.
+
+    Triage agents hand off by keyword, specialist agents call their best
+    matching tool with arguments pulled from the user's message, and the
+    final answer echoes the tool output. The number of calls, handoffs and
+    prompt tokens therefore depends only on the agent graph, instructions,
+    tools and history handling under test.
+    """
+
+    def __init__(self):
+        # Call and message IDs end up in the history, so each model numbers its own
+        self._ids = count(1)
+
+    async def get_response(self, system_instructions, input, model_settings, tools, output_schema, handoffs, *args, **kwargs):
+        items = [{"role": "user", "content": input}] if isinstance(input, str) else list(input)
+        output = self._respond(items, tools or [], handoffs or [])
+        prompt_tokens = estimate_tokens(system_instructions, items, [getattr(t, "params_json_schema", "") for t in tools or []], completion_tokens=0)
+        output_tokens = estimate_tokens(output, completion_tokens=0)
+        return ModelResponse(
+            output=[output],
+            usage=Usage(requests=1, input_tokens=prompt_tokens, output_tokens=output_tokens, total_tokens=prompt_tokens + output_tokens),
+            referenceable_id=None,
+        )
+
+    async def stream_response(self, system_instructions, input, model_settings, tools, output_schema, handoffs, *args, **kwargs):
+        """Stream the same answer as `get_response`, as a single completed event."""
+        response = await self.get_response(system_instructions, input, model_settings, tools, output_schema, handoffs, *args, **kwargs)
+        yield ResponseCompletedEvent(
+            response=Response(
+                id=f"resp_{next(self._ids)}",
+                created_at=time.time(),
+                model="mock",
+                object="response",
+                output=response.output,
+                tool_choice="auto",
+                tools=[],
+                parallel_tool_calls=False,
+                usage=ResponseUsage(
+                    input_tokens=response.usage.input_tokens,
+                    output_tokens=response.usage.output_tokens,
+                    total_tokens=response.usage.total_tokens,
+                    output_tokens_details=OutputTokensDetails(reasoning_tokens=0),
+                ),
+            ),
+            type="response.completed",
+        )
+
+    def _respond(self, items: List[Any], tools: List[Any], handoffs: List[Any]):
+        last = items[-1] if items else {}
+        message = _last_user_message(items)
+
+        if _item(last, "type") == "function_call_output":
+            call = next((i for i in items if _item(i, "type") == "function_call" and _item(i, "call_id") == _item(last, "call_id")), None)
+            if call is None or not _item(call, "name").startswith("transfer_to_"):
+                # A real tool answered, reply with its output
+                return self._message(str(_item(last, "output")))
+
+        if handoffs:
+            text = f" {message.lower()} "
+            target = next((name for name, words in ROUTES if any(w in text for w in words)), FALLBACK_ROUTE)
+            handoff = next((h for h in handoffs if h.agent_name == target), handoffs[0])
+            return self._call(handoff.tool_name, {})
+
+        if tools:
+            tool = self._pick_tool(message, tools)
+            return self._call(tool.name, self._arguments(message, tool.params_json_schema))
+
+        return self._message("How else can I help you today?")
+
+    def _pick_tool(self, message: str, tools: List[Any]):
+        text = message.lower()
+        by_name = {t.name: t for t in tools}
+        if "track_delivery" in by_name and any(w in text for w in ("track", "driver", "where is")):
+            return by_name["track_delivery"]
+        if "update_order" in by_name and any(w in text for w in ("cancel", "add", "remove", "change")):
+            return by_name["update_order"]
+        return by_name.get("check_order_status", tools[0])
+
+    def _arguments(self, message: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+        text = message.lower()
+        found = {
+            "order_id": _ORDER_ID.search(message),
+            "date": _DATE.search(message),
+            "time": _TIME.search(message),
+        }
+        party_size = _PARTY_SIZE.search(text)
+        arguments: Dict[str, Any] = {}
+        for name, spec in schema.get("properties", {}).items():
+            kind = spec.get("type")
+            if isinstance(kind, list):
+                kind = next((k for k in kind if k != "null"), "string")
+            if name in found:
+                arguments[name] = found[name].group(0) if found[name] else ""
+            elif name == "party_size":
+                arguments[name] = int(party_size.group(1)) if party_size else 2
+            elif name in ("query", "complaint", "details"):
+                arguments[name] = message
+            elif name == "request_type":
+                arguments[name] = next((t for t in ("cancel", "modify", "availability", "check") if t in text), "make")
+            elif name == "update_type":
+                arguments[name] = next((t for w, t in (("cancel", "cancel"), ("add", "add_item"), ("remove", "remove_item"), ("address", "change_address")) if w in text), "cancel")
+            elif kind == "integer":
+                arguments[name] = 1
+            elif kind == "boolean":
+                arguments[name] = False
+            elif name in schema.get("required", []):
+                arguments[name] = "general" if name == "category" else ""
+        return arguments
+
+    def _call(self, name: str, arguments: Dict[str, Any]) -> ResponseFunctionToolCall:
+        call_id = f"call_{next(self._ids)}"
+        return ResponseFunctionToolCall(id=call_id, call_id=call_id, name=name, arguments=json.dumps(arguments), type="function_call")
+
+    def _message(self, text: str) -> ResponseOutputMessage:
+        return ResponseOutputMessage(
+            id=f"msg_{next(self._ids)}",
+            content=[ResponseOutputText(text=text, annotations=[], type="output_text")],
+            role="assistant",
+            status="completed",
+            type="message",
+        )
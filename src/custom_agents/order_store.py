@@ -0,0 +1,102 @@
+import threading
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from custom_agents.tenants import get_tenant
+
+# Order statuses after which the order no longer changes
+FINAL_STATUSES = frozenset({"delivered", "cancelled"})
+
+# Called with (tenant_id, order_id, kind) after every write to any order store,
+# where kind is "order" for the order itself and "tracking" for its delivery tracking
+OrderListener = Callable[[str, str, str], None]
+_listeners: List[OrderListener] = []
+
+
+def on_order_change(listener: OrderListener) -> None:
+    """Register a callback invoked after an order or its tracking data changes."""
+    _listeners.append(listener)
+
+
+class OrderStore:
+    """Live order and delivery tracking data for one tenant.
+
+    Seeded from the tenant's order fixtures; kitchen, driver and tool updates
+    are written here and announced to the registered listeners. The store is
+    seeded once per process: later edits to the order fixtures in a reloaded
+    tenant file don't overwrite live orders and take effect only after a
+    restart or `reset_order_stores()`.
+    """
+
+    def __init__(self, tenant_id: str):
+        tenant = get_tenant(tenant_id)
+        self.tenant_id = tenant.tenant_id
+        self._orders: Dict[str, Dict[str, Any]] = {k: dict(v) for k, v in tenant.orders.items()}
+        self._tracking: Dict[str, Dict[str, Any]] = {k: dict(v) for k, v in tenant.tracking.items()}
+        self._lock = threading.Lock()
+
+    def get(self, order_id: str) -> Optional[Mapping[str, Any]]:
+        """Return a copy of the order, or None if it doesn't exist."""
+        order = self._orders.get(order_id)
+        return dict(order) if order is not None else None
+
+    def tracking(self, order_id: str) -> Optional[Mapping[str, Any]]:
+        """Return a copy of the order's delivery tracking data, or None if not tracked."""
+        info = self._tracking.get(order_id)
+        return dict(info) if info is not None else None
+
+    def update(self, order_id: str, **changes: Any) -> None:
+        """Apply changes to an order (e.g. status, eta_minutes, items) and notify listeners."""
+        with self._lock:
+            self._orders.setdefault(order_id, {}).update(changes)
+        self._notify(order_id, "order")
+
+    def update_tracking(self, order_id: str, **changes: Any) -> None:
+        """Apply changes to an order's tracking data (e.g. current_location) and notify listeners."""
+        with self._lock:
+            self._tracking.setdefault(order_id, {}).update(changes)
+        self._notify(order_id, "tracking")
+
+    def _notify(self, order_id: str, kind: str) -> None:
+        for listener in _listeners:
+            listener(self.tenant_id, order_id, kind)
+
+
+_stores: Dict[str, OrderStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_order_store(tenant_id: str) -> OrderStore:
+    """Return the tenant's order store, creating it on first use."""
+    store = _stores.get(tenant_id)
+    if store is None:
+        with _stores_lock:
+            store = _stores.setdefault(tenant_id, OrderStore(tenant_id))
+    return store
+
+
+def reset_order_stores() -> None:
+    """Drop all live order data; stores are reseeded from the tenant fixtures on next use."""
+    with _stores_lock:
+        _stores.clear()
+
+
+def describe_order(order_id: str, order: Mapping[str, Any]) -> str:
+    """Customer-facing description of an order's status."""
+    items = ', '.join(order.get('items', ()))
+    if order["status"] == "preparing":
+        return f"Your order {order_id} is being prepared and will be delivered in {order['eta_minutes']} minutes. Items: {items}."
+    elif order["status"] == "dispatched":
+        return f"Your order {order_id} has been dispatched and will arrive in {order['eta_minutes']} minutes. Items: {items}."
+    elif order["status"] == "processing":
+        return f"Your order {order_id} is still being processed. Estimated delivery in {order['eta_minutes']} minutes. Items: {items}."
+    elif order["status"] == "delivered":
+        return f"Your order {order_id} was delivered at {order['delivery_time']}. Items: {items}."
+    elif order["status"] == "cancelled":
+        return f"Your order {order_id} was cancelled. Reason: {order['reason']}. Items: {items}."
+    else:
+        return f"Your order {order_id} status: {order['status']}. Please contact customer service for more information."
+
+
+def describe_tracking(info: Mapping[str, Any]) -> str:
+    """Customer-facing description of a delivery's tracking data."""
+    return f"Driver {info['driver_name']} is currently {info['current_location']}. Expected arrival in {info['eta_minutes']} minutes. Driver contact: {info['contact']}"
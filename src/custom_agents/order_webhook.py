@@ -0,0 +1,52 @@
+import hmac
+import os
+from typing import Any, Dict
+
+from fastapi import FastAPI, HTTPException, Request
+
+from custom_agents.order_store import get_order_store
+from custom_agents.tenants import all_tenants
+
+# Shared secret the kitchen and driver systems send as "Authorization: Bearer <token>";
+# the endpoint is disabled while it is unset
+ORDER_WEBHOOK_TOKEN = os.getenv("ORDER_WEBHOOK_TOKEN", "")
+
+
+def apply_order_event(tenant_id: str, order_id: str, event: Dict[str, Any]) -> None:
+    """Write a kitchen or driver update into the tenant's order store.
+
+    Args:
+        tenant_id: The restaurant the order belongs to
+        order_id: The order that changed
+        event: Order fields to change (e.g. {"status": "dispatched", "eta_minutes": 15}),
+            plus an optional "tracking" object with the driver's data
+    """
+    store = get_order_store(tenant_id)
+    changes = {key: value for key, value in event.items() if key != "tracking"}
+    if changes:
+        store.update(order_id, **changes)
+    if event.get("tracking"):
+        store.update_tracking(order_id, **event["tracking"])
+
+
+def register_order_webhook(app: FastAPI, token: str = ORDER_WEBHOOK_TOKEN) -> None:
+    """Add ``POST /orders/{tenant_id}/{order_id}`` for external order status updates.
+
+    Subscribed chats are notified through the order store's listeners, like
+    for changes made by the tools.
+    """
+    if not token:
+        print("[ORDER_WEBHOOK] disabled, set ORDER_WEBHOOK_TOKEN to receive kitchen and driver updates")
+        return
+
+    @app.post("/orders/{tenant_id}/{order_id}")
+    async def order_event(tenant_id: str, order_id: str, request: Request):
+        if not hmac.compare_digest(request.headers.get("authorization", ""), f"Bearer {token}"):
+            raise HTTPException(status_code=401, detail="Invalid token")
+        if tenant_id not in all_tenants():
+            raise HTTPException(status_code=404, detail="Unknown tenant")
+        event = await request.json()
+        if not isinstance(event, dict) or not isinstance(event.get("tracking", {}), dict):
+            raise HTTPException(status_code=400, detail="Expected a JSON object")
+        apply_order_event(tenant_id, order_id, event)
+        return {"status": "ok"}
@@ -0,0 +1,224 @@
+import asyncio
+import os
+import time
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from agents.models.interface import Model
+
+# Provider quota shared by every session in the process
+MODEL_REQUESTS_PER_MINUTE = int(os.getenv("MODEL_REQUESTS_PER_MINUTE", "15"))
+MODEL_TOKENS_PER_MINUTE = int(os.getenv("MODEL_TOKENS_PER_MINUTE", "1000000"))
+# Seconds a model call may wait in the queue before the user is asked to hold
+HOLD_AFTER_SECONDS = float(os.getenv("HOLD_AFTER_SECONDS", "10"))
+
+
+class TokenBucket:
+    """Continuously refilling bucket allowing `rate_per_minute` units per minute."""
+
+    def __init__(self, rate_per_minute: float):
+        self.capacity = float(rate_per_minute)
+        self.tokens = self.capacity
+        self.refill_per_second = rate_per_minute / 60.0
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_second)
+        self.updated = now
+
+    def time_until(self, amount: float) -> float:
+        """Seconds until `amount` units are available (0 if available now)."""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_per_second
+
+    def consume(self, amount: float) -> None:
+        """Take units out of the bucket. Negative amounts give units back."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+@dataclass(slots=True)
+class ModelTurn:
+    """One user turn, which may issue several model calls (triage, handoff, tool follow-ups).
+
+    Attributes:
+        session_id: The chat session the turn belongs to
+        on_hold: Called once if a model call of this turn waits longer than the SLA
+        calls: Number of model calls already admitted for this turn
+        held: Whether the hold callback has already fired
+    """
+    session_id: str
+    on_hold: Optional[Callable[[], Awaitable[None]]] = None
+    calls: int = 0
+    held: bool = False
+
+
+# The turn currently being processed, set by the message handler
+current_turn: ContextVar[Optional[ModelTurn]] = ContextVar("current_turn", default=None)
+
+
+@dataclass(slots=True)
+class _Waiter:
+    tokens: int
+    future: asyncio.Future
+    enqueued: float = field(default_factory=time.monotonic)
+
+
+class ModelCallLimiter:
+    """Admission control for model calls shared by all sessions in the process.
+
+    Calls wait in a queue per session and are admitted round-robin across
+    sessions, so a single chatty user cannot starve the others. Calls from a
+    turn that has already started (multi-step runs) are admitted before the
+    first call of new turns, so in-flight answers finish first.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = MODEL_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = MODEL_TOKENS_PER_MINUTE,
+        hold_after_seconds: float = HOLD_AFTER_SECONDS,
+    ):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.hold_after_seconds = hold_after_seconds
+        # Two rings of per-session queues: in-flight turns first, then new turns
+        self._in_flight: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+        self._new: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
+        # Metrics
+        self.admitted = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.holds = 0
+
+    def queue_depth(self) -> int:
+        """Number of model calls currently waiting for admission."""
+        return sum(len(q) for ring in (self._in_flight, self._new) for q in ring.values())
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of queue depth and wait times."""
+        return {
+            "queue_depth": self.queue_depth(),
+            "waiting_sessions": len(self._in_flight.keys() | self._new.keys()),
+            "admitted": self.admitted,
+            "avg_wait_seconds": self.total_wait / self.admitted if self.admitted else 0.0,
+            "max_wait_seconds": self.max_wait,
+            "holds": self.holds,
+        }
+
+    async def acquire(self, turn: Optional[ModelTurn], tokens: int) -> None:
+        """Wait until a model call estimated at `tokens` tokens may be sent.
+
+        Args:
+            turn: The turn issuing the call, or None for calls outside a chat turn
+            tokens: Estimated prompt plus completion tokens of the call
+        """
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+
+        session_id = turn.session_id if turn else ""
+        ring = self._in_flight if turn and turn.calls else self._new
+        waiter = _Waiter(tokens=tokens, future=asyncio.get_running_loop().create_future())
+        ring.setdefault(session_id, deque()).append(waiter)
+        self._wakeup.set()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), self.hold_after_seconds)
+        except asyncio.TimeoutError:
+            if turn and turn.on_hold and not turn.held:
+                turn.held = True
+                self.holds += 1
+                await turn.on_hold()
+            await waiter.future
+        finally:
+            # Drop the waiter if the caller was cancelled before admission
+            if not waiter.future.done():
+                waiter.future.cancel()
+
+        if turn:
+            turn.calls += 1
+
+    def settle(self, estimated: int, actual: int) -> None:
+        """Correct the token bucket once the real usage of a call is known."""
+        self.tokens.consume(actual - estimated)
+
+    def _next(self) -> Optional["OrderedDict[str, Deque[_Waiter]]"]:
+        """Return the ring holding the next waiter to admit, dropping cancelled waiters."""
+        for ring in (self._in_flight, self._new):
+            for session_id in list(ring):
+                queue = ring[session_id]
+                while queue and queue[0].future.done():
+                    queue.popleft()
+                if not queue:
+                    del ring[session_id]
+            if ring:
+                return ring
+        return None
+
+    async def _dispatch(self) -> None:
+        while True:
+            ring = self._next()
+            if ring is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            session_id, queue = next(iter(ring.items()))
+            waiter = queue[0]
+            delay = max(self.requests.time_until(1), self.tokens.time_until(waiter.tokens))
+            if delay > 0:
+                # Re-evaluate after sleeping, a higher priority call may have arrived
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            queue.popleft()
+            # Move the session to the back of the ring for round-robin fairness
+            ring.move_to_end(session_id)
+            if waiter.future.done():
+                continue
+            self.requests.consume(1)
+            self.tokens.consume(waiter.tokens)
+            wait = time.monotonic() - waiter.enqueued
+            self.admitted += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            waiter.future.set_result(None)
+
+
+def estimate_tokens(*parts: Any, completion_tokens: int = 512) -> int:
+    """Rough token estimate for a model call (about four characters per token)."""
+    return sum(len(str(part)) for part in parts if part) // 4 + completion_tokens
+
+
+class RateLimitedModel(Model):
+    """Model wrapper that admits every call through a shared `ModelCallLimiter`."""
+
+    def __init__(self, model: Model, limiter: ModelCallLimiter):
+        self.model = model
+        self.limiter = limiter
+
+    async def get_response(self, system_instructions, input, *args, **kwargs):
+        estimated = estimate_tokens(system_instructions, input)
+        await self.limiter.acquire(current_turn.get(), estimated)
+        response = await self.model.get_response(system_instructions, input, *args, **kwargs)
+        usage = getattr(response, "usage", None)
+        if usage is not None and getattr(usage, "total_tokens", 0):
+            self.limiter.settle(estimated, usage.total_tokens)
+        return response
+
+    async def stream_response(self, system_instructions, input, *args, **kwargs):
+        await self.limiter.acquire(current_turn.get(), estimate_tokens(system_instructions, input))
+        async for event in self.model.stream_response(system_instructions, input, *args, **kwargs):
+            yield event
@@ -0,0 +1,72 @@
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Conversations are recorded only when this is set
+RECORDINGS_DIR = os.getenv("RECORDINGS_DIR", "")
+
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+(\.[\w-]+)+")
+# A run of 7+ digits, or groups of 2-4 digits with an optional country code and
+# area code. A match can't start or end inside a number, date or time, so
+# 5-digit order IDs and "2026-11-06 19:00" survive.
+_PHONE = re.compile(
+    r"(?<![\w:.-])"
+    r"(?:\+?\d{7,15}|(?:\+\d{1,3}[\s.-]?)?(?:\(\d{2,4}\)[\s.-]?)?\d{2,4}(?:[\s.-]\d{2,4}){1,4})"
+    r"(?![\w:])"
+)
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+# Explicit introductions mask the next word even if it isn't capitalized;
+# "I am" / "this is" only mask capitalized names (not "I am hungry")
+_NAME = re.compile(
+    r"\b((?i:my name is|under the name|name:))\s+[A-Za-z][a-z'-]*(\s+[A-Z][a-z]+)?"
+    r"|\b((?i:i am|i'm|this is))\s+[A-Z][a-z]+(\s+[A-Z][a-z]+)?"
+)
+
+
+def _mask_phone(match: re.Match) -> str:
+    text = match.group(0)
+    if sum(c.isdigit() for c in text) < 7 or _DATE.fullmatch(text):
+        return text
+    return "<phone>"
+
+
+def anonymize(text: str) -> str:
+    """Replace emails, phone numbers and self-introduced names with placeholders."""
+    text = _EMAIL.sub("<email>", text)
+    text = _PHONE.sub(_mask_phone, text)
+    return _NAME.sub(lambda m: f"{m.group(1) or m.group(3)} <name>", text)
+
+
+def record_turn(session_id: str, tenant_id: str, content: str, directory: str = RECORDINGS_DIR) -> None:
+    """Append an anonymized user message to the session's recording.
+
+    Args:
+        session_id: The chat session the message belongs to
+        tenant_id: The restaurant the session is talking to
+        content: The user's message
+        directory: Where recordings are written; nothing is recorded if empty
+    """
+    if not directory:
+        return
+    path = Path(directory) / f"{session_id}.jsonl"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"tenant_id": tenant_id, "user": anonymize(content)}) + "\n")
+
+
+def load_recording(path: Path) -> Optional[Dict]:
+    """Read a recording back as {"tenant_id": ..., "turns": [user messages]}."""
+    turns: List[str] = []
+    tenant_id = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            tenant_id = tenant_id or entry["tenant_id"]
+            turns.append(entry["user"])
+    if not turns:
+        return None
+    return {"tenant_id": tenant_id, "turns": turns}
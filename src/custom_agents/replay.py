@@ -0,0 +1,153 @@
+"""Replay recorded conversations through the agent graph against the mock model.
+
+Usage:
+    python -m custom_agents.replay RECORDINGS_DIR --out report.json
+    python -m custom_agents.replay RECORDINGS_DIR --baseline report.json
+
+Each recording is re-driven turn by turn, exactly like the chat handler does
+(history in, `to_input_list()` out), and measured for model calls, handoffs,
+prompt tokens and wall time. With --baseline the results are compared per
+conversation and the command exits with status 1 when a threshold is passed.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from agents import Runner
+from agents.items import HandoffOutputItem
+from agents.run import RunConfig
+
+from custom_agents.context import SessionContext
+from custom_agents.mock_model import MockModel
+from custom_agents.order_store import reset_order_stores
+from custom_agents.recorder import load_recording
+from custom_agents.restaurant_agents import build_triage_agent
+from custom_agents.tool_cache import dedupe_tool_outputs, tool_cache
+
+METRICS = ("model_calls", "handoffs", "prompt_tokens", "wall_seconds")
+
+
+async def _replay(recording: Dict) -> Dict[str, float]:
+    # Worker processes are reused, so start every conversation from the same
+    # order data and an empty tool cache regardless of what ran before it
+    reset_order_stores()
+    tool_cache.clear()
+    agent = build_triage_agent()
+    config = RunConfig(model=MockModel(), tracing_disabled=True)
+    context = SessionContext(tenant_id=recording["tenant_id"])
+    history: List = []
+    totals = dict.fromkeys(METRICS, 0)
+
+    start = time.perf_counter()
+    for turn in recording["turns"]:
+        history.append({"role": "user", "content": turn})
+        result = await Runner.run(starting_agent=agent, input=history, context=context, run_config=config)
+        history = dedupe_tool_outputs(result.to_input_list())
+        totals["model_calls"] += len(result.raw_responses)
+        totals["handoffs"] += sum(isinstance(item, HandoffOutputItem) for item in result.new_items)
+        totals["prompt_tokens"] += sum(r.usage.input_tokens for r in result.raw_responses)
+    totals["wall_seconds"] = round(time.perf_counter() - start, 4)
+    return totals
+
+
+def replay_file(path: str) -> Tuple[str, Optional[Dict[str, float]]]:
+    """Replay one recording file (runs in a worker process)."""
+    recording = load_recording(Path(path))
+    if recording is None:
+        return Path(path).stem, None
+    return Path(path).stem, asyncio.run(_replay(recording))
+
+
+def replay_directory(directory: Path, workers: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+    """Replay every recording in a directory, in parallel across processes.
+
+    Returns:
+        Metrics keyed by conversation name
+    """
+    paths = sorted(str(p) for p in Path(directory).glob("*.jsonl"))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return {name: metrics for name, metrics in pool.map(replay_file, paths) if metrics is not None}
+
+
+def compare(
+    baseline: Dict[str, Dict[str, float]],
+    current: Dict[str, Dict[str, float]],
+    thresholds: Dict[str, float],
+    wall_time_floor: float = 0.05,
+) -> List[str]:
+    """Return one line per conversation and metric that regressed past its threshold.
+
+    Thresholds are allowed relative increases (0.1 = +10%); model calls and
+    handoffs are compared in absolute numbers. Wall time changes smaller than
+    `wall_time_floor` seconds are treated as noise.
+    """
+    failures = []
+    for name, metrics in current.items():
+        if name not in baseline:
+            continue
+        for metric in METRICS:
+            old, new = baseline[name][metric], metrics[metric]
+            if metric in ("model_calls", "handoffs"):
+                regressed = new - old > thresholds[metric]
+            else:
+                regressed = old > 0 and (new - old) / old > thresholds[metric]
+                if metric == "wall_seconds":
+                    regressed = regressed and new - old > wall_time_floor
+            if regressed:
+                failures.append(f"{name}: {metric} {old} -> {new}")
+    return failures
+
+
+def _print_report(baseline: Dict, current: Dict) -> None:
+    print(f"{'conversation':<40}" + "".join(f"{m:>22}" for m in METRICS))
+    for name, metrics in sorted(current.items()):
+        old = baseline.get(name, {})
+        cells = []
+        for metric in METRICS:
+            if metric in old:
+                cells.append(f"{old[metric]} -> {metrics[metric]}")
+            else:
+                cells.append(str(metrics[metric]))
+        print(f"{name:<40}" + "".join(f"{c:>22}" for c in cells))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recordings", type=Path, help="Directory of recorded conversations (*.jsonl)")
+    parser.add_argument("--out", type=Path, help="Write the metrics to this JSON report")
+    parser.add_argument("--baseline", type=Path, help="Compare against a previous JSON report")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--max-model-calls", type=float, default=0, help="Allowed extra model calls per conversation")
+    parser.add_argument("--max-handoffs", type=float, default=0, help="Allowed extra handoffs per conversation")
+    parser.add_argument("--max-prompt-tokens", type=float, default=0.05, help="Allowed relative prompt token increase")
+    parser.add_argument("--max-wall-time", type=float, default=0.5, help="Allowed relative wall time increase")
+    parser.add_argument("--wall-time-floor", type=float, default=0.05, help="Ignore wall time changes below this many seconds")
+    args = parser.parse_args(argv)
+
+    current = replay_directory(args.recordings, args.workers)
+    if args.out:
+        args.out.write_text(json.dumps(current, indent=2, sort_keys=True))
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else {}
+    _print_report(baseline, current)
+    if not baseline:
+        return 0
+
+    failures = compare(baseline, current, {
+        "model_calls": args.max_model_calls,
+        "handoffs": args.max_handoffs,
+        "prompt_tokens": args.max_prompt_tokens,
+        "wall_seconds": args.max_wall_time,
+    }, args.wall_time_floor)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from custom_agents.context import SessionContext
+
+# Histories of sessions idle for this long are kept compressed in memory
+SESSION_PACK_SECONDS = float(os.getenv("SESSION_PACK_SECONDS", "120"))
+# Sessions idle for this long are moved to the persistent store
+SESSION_EVICT_MINUTES = float(os.getenv("SESSION_EVICT_MINUTES", "30"))
+# Evicted histories contain customer details, so the directory and files are private to this user
+SESSION_STORE_DIR = Path(os.getenv("SESSION_STORE_DIR", Path(tempfile.gettempdir()) / "restaurant-sessions"))
+SESSION_SWEEP_SECONDS = float(os.getenv("SESSION_SWEEP_SECONDS", "30"))
+
+_ROLES = {role: sys.intern(role) for role in ("user", "assistant", "system", "developer", "tool")}
+
+
+def _intern_roles(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Share one string object per role across all messages of all sessions."""
+    for item in items:
+        role = item.get("role") if isinstance(item, dict) else None
+        if role in _ROLES:
+            item["role"] = _ROLES[role]
+    return items
+
+
+class CompactHistory:
+    """A chat history kept either as a list of messages or as zlib-compressed JSON."""
+
+    __slots__ = ("_items", "_packed")
+
+    def __init__(self, items: Optional[List[Dict[str, Any]]] = None, packed: Optional[bytes] = None):
+        self._items = _intern_roles(items) if items is not None else (None if packed else [])
+        self._packed = packed
+
+    @property
+    def is_packed(self) -> bool:
+        return self._items is None
+
+    def items(self) -> List[Dict[str, Any]]:
+        """Return the messages, inflating them if the history is packed."""
+        if self._items is None:
+            self._items = _intern_roles(json.loads(zlib.decompress(self._packed)))
+            self._packed = None
+        return self._items
+
+    def replace(self, items: List[Dict[str, Any]]) -> None:
+        self._items = _intern_roles(items)
+        self._packed = None
+
+    def pack(self) -> bytes:
+        """Compress the messages and release the list. Returns the compressed bytes."""
+        if self._items is not None:
+            self._packed = zlib.compress(json.dumps(self._items, separators=(",", ":")).encode("utf-8"))
+            self._items = None
+        return self._packed
+
+
+def _write_private(store: Path, path: Path, data: bytes) -> None:
+    """Write a file readable only by this user into a directory only this user can access."""
+    store.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # Fails if the directory was created by another user
+    os.chmod(store, 0o700)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.chmod(path, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+
+
+class SessionRecord:
+    """Everything kept in memory for one connected chat session.
+
+    Attributes:
+        context: The run context passed to the agents and tools
+        last_active: time.monotonic() of the last message
+    """
+
+    __slots__ = ("context", "last_active", "_history", "_store")
+
+    def __init__(self, context: SessionContext, store: Path):
+        self.context = context
+        self.last_active = time.monotonic()
+        self._history: Optional[CompactHistory] = CompactHistory()
+        self._store = store
+
+    @property
+    def evicted(self) -> bool:
+        return self._history is None
+
+    def _path(self) -> Path:
+        return self._store / f"{self.context.session_id}.z"
+
+    def history(self) -> List[Dict[str, Any]]:
+        """Return the chat history, restoring it from the store if it was evicted."""
+        self.last_active = time.monotonic()
+        if self._history is None:
+            path = self._path()
+            try:
+                self._history = CompactHistory(packed=path.read_bytes())
+            except OSError as e:
+                # The stored history is gone (e.g. the temp directory was cleaned), start over
+                print(f"[SESSION_RESTORE_FAILED] {self.context.session_id}: {e}")
+                self._history = CompactHistory()
+            path.unlink(missing_ok=True)
+        return self._history.items()
+
+    def set_history(self, items: List[Dict[str, Any]]) -> None:
+        self.last_active = time.monotonic()
+        if self._history is None:
+            self._path().unlink(missing_ok=True)
+            self._history = CompactHistory()
+        self._history.replace(items)
+
+    def pack(self) -> bool:
+        """Compress the history in memory. Returns True if it was unpacked before."""
+        if self._history is None or self._history.is_packed:
+            return False
+        self.context.tool_cache.clear()
+        self._history.pack()
+        return True
+
+    def evict(self) -> None:
+        """Write the compressed history to the store and drop it from memory."""
+        if self._history is None:
+            return
+        self.context.tool_cache.clear()
+        _write_private(self._store, self._path(), self._history.pack())
+        self._history = None
+
+    def discard(self) -> None:
+        """Forget the session, including anything in the store."""
+        self._path().unlink(missing_ok=True)
+        self._history = CompactHistory()
+
+
+class SessionRegistry:
+    """Tracks connected sessions and shrinks the ones that go idle."""
+
+    def __init__(
+        self,
+        store: Path = SESSION_STORE_DIR,
+        pack_after_seconds: float = SESSION_PACK_SECONDS,
+        evict_after_seconds: float = SESSION_EVICT_MINUTES * 60,
+    ):
+        self.store = Path(store)
+        self.pack_after_seconds = pack_after_seconds
+        self.evict_after_seconds = evict_after_seconds
+        self._sessions: Dict[str, SessionRecord] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def open(self, session_id: str, tenant_id: str) -> SessionRecord:
+        """Create the record of a newly connected session."""
+        context = SessionContext(tenant_id=sys.intern(tenant_id), session_id=session_id)
+        # Remember the tenant's configuration in case a later reload removes it
+        context.tenant
+        record = SessionRecord(context, self.store)
+        self._sessions[session_id] = record
+        return record
+
+    def close(self, session_id: str) -> None:
+        """Drop a disconnected session."""
+        record = self._sessions.pop(session_id, None)
+        if record is not None:
+            record.discard()
+
+    def sweep(self, now: Optional[float] = None) -> Tuple[int, int]:
+        """Pack or evict idle sessions. Returns (packed, evicted) counts."""
+        now = time.monotonic() if now is None else now
+        packed = evicted = 0
+        for record in self._sessions.values():
+            idle = now - record.last_active
+            if idle >= self.evict_after_seconds and not record.evicted:
+                try:
+                    record.evict()
+                    evicted += 1
+                    continue
+                except Exception as e:
+                    # Keep sweeping the other sessions; this one stays in memory, packed
+                    print(f"[SESSIONS] evict failed for {record.context.session_id}: {e}")
+            if idle >= self.pack_after_seconds and record.pack():
+                packed += 1
+        return packed, evicted
+
+    def start(self, interval: float = SESSION_SWEEP_SECONDS) -> None:
+        """Start sweeping periodically on the running event loop (idempotent)."""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.get_running_loop().create_task(self._run(interval))
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                packed, evicted = self.sweep()
+                if packed or evicted:
+                    print(f"[SESSIONS] active={len(self)} packed={packed} evicted={evicted}")
+            except Exception as e:
+                print(f"[SESSIONS] sweep failed: {e}")
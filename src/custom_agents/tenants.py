@@ -0,0 +1,227 @@
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from custom_agents.content import ReloadableContent, load_data_file
+
+# Directory holding one JSON file per restaurant location
+TENANTS_DIR = Path(os.getenv("TENANTS_DIR", Path(__file__).parent / "data" / "tenants"))
+DEFAULT_TENANT_ID = os.getenv("DEFAULT_TENANT", "abc")
+
+
+@dataclass(frozen=True, slots=True)
+class Tenant:
+    """Immutable per-restaurant configuration shared by every session of that tenant.
+
+    Attributes:
+        tenant_id: Short identifier used to select the tenant (e.g. "abc")
+        name: Display name of the restaurant
+        phone: Public phone number quoted in tool responses
+        faq: FAQ topics mapped to their subtopic answers
+        faq_terms: FAQ topics mapped to (subtopic, search term) pairs
+        orders: Order fixtures keyed by order ID
+        tracking: Delivery tracking fixtures keyed by order ID
+        modifiable_orders: Order IDs that can still be changed
+    """
+    tenant_id: str
+    name: str
+    phone: str
+    faq: Mapping[str, Mapping[str, str]]
+    faq_terms: Mapping[str, Tuple[Tuple[str, str], ...]]
+    orders: Mapping[str, Mapping[str, Any]]
+    tracking: Mapping[str, Mapping[str, Any]]
+    modifiable_orders: frozenset
+
+    def prompt_vars(self) -> Dict[str, str]:
+        """Variables substituted into the agent instructions."""
+        return {"restaurant_name": self.name, "phone": self.phone}
+
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _freeze(value: Any) -> Any:
+    """Convert parsed JSON into read-only structures.
+
+    Strings are interned so that text repeated across tenants (shared FAQ
+    answers, status names, dictionary keys) is stored only once per process.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k): _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def _overlay(base: Mapping[str, Any], override: Dict[str, Any]) -> Mapping[str, Any]:
+    """Freeze a tenant's overrides on top of the frozen tenant it extends.
+
+    Values the override doesn't touch are the parent's own objects, so an
+    extending tenant only costs memory for what it changes.
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        key = sys.intern(key)
+        if isinstance(value, dict) and isinstance(merged.get(key), Mapping):
+            merged[key] = _overlay(merged[key], value)
+        else:
+            merged[key] = _freeze(value)
+    return MappingProxyType(merged)
+
+
+def _render_faq(faq: Mapping[str, Mapping[str, str]], variables: Dict[str, str]) -> Mapping[str, Mapping[str, str]]:
+    """Fill {restaurant_name} and {phone} into the FAQ answers.
+
+    Topics without placeholders are kept as they are, so they stay shared
+    with the tenant they were inherited from.
+    """
+    rendered = {}
+    for topic, subtopics in faq.items():
+        if any(isinstance(answer, str) and "{" in answer for answer in subtopics.values()):
+            filled = {}
+            for subtopic, answer in subtopics.items():
+                if isinstance(answer, str):
+                    for name, value in variables.items():
+                        answer = answer.replace(f"{{{name}}}", value)
+                    answer = sys.intern(answer)
+                filled[subtopic] = answer
+            subtopics = MappingProxyType(filled)
+        rendered[topic] = subtopics
+    return MappingProxyType(rendered)
+
+
+def _compile_faq_terms(
+    faq: Mapping[str, Mapping[str, str]], parent: Optional[Tenant] = None
+) -> Mapping[str, Tuple[Tuple[str, str], ...]]:
+    """Precompute the text searched for each subtopic (underscores become spaces).
+
+    Topics shared with the parent tenant reuse the parent's compiled terms.
+    """
+    terms = {}
+    for topic, subtopics in faq.items():
+        if parent is not None and parent.faq.get(topic) is subtopics:
+            terms[topic] = parent.faq_terms[topic]
+        else:
+            terms[topic] = tuple((subtopic, sys.intern(subtopic.replace("_", " "))) for subtopic in subtopics)
+    return MappingProxyType(terms)
+
+
+def _build_tenants(paths: List[Path]) -> Mapping[str, Tenant]:
+    """Build tenants from their definition files.
+
+    A tenant file may set "extends" to the ID of another tenant, in which case
+    only the fields that differ need to be listed. FAQ answers may use the
+    {restaurant_name} and {phone} placeholders, so an extending tenant that
+    only changes its phone number quotes the new number everywhere.
+    """
+    raw: Dict[str, Dict[str, Any]] = {}
+    files: Dict[str, Path] = {}
+    for path in paths:
+        data = load_data_file(path)
+        tenant_id = data.get("tenant_id", path.stem)
+        raw[tenant_id] = data
+        files[tenant_id] = path
+
+    frozen: Dict[str, Mapping[str, Any]] = {}
+    built: Dict[str, Tenant] = {}
+
+    def build(tenant_id: str, seen: tuple = ()) -> Tenant:
+        if tenant_id in built:
+            return built[tenant_id]
+        if tenant_id in seen:
+            raise ValueError(f"{files[tenant_id]}: circular 'extends' chain for tenant '{tenant_id}'")
+        data = raw[tenant_id]
+        parent = None
+        parent_id = data.get("extends")
+        if parent_id:
+            if parent_id not in raw:
+                raise ValueError(f"{files[tenant_id]}: tenant '{tenant_id}' extends unknown tenant '{parent_id}'")
+            parent = build(parent_id, seen + (tenant_id,))
+            config = _overlay(frozen[parent_id], data)
+        else:
+            config = _freeze(data)
+        frozen[tenant_id] = config
+
+        faq = _render_faq(config.get("faq", _EMPTY), {"restaurant_name": config["name"], "phone": config["phone"]})
+        modifiable = config.get("modifiable_orders", ())
+        built[tenant_id] = Tenant(
+            tenant_id=sys.intern(tenant_id),
+            name=config["name"],
+            phone=config["phone"],
+            faq=faq,
+            faq_terms=_compile_faq_terms(faq, parent),
+            orders=config.get("orders", _EMPTY),
+            tracking=config.get("tracking", _EMPTY),
+            modifiable_orders=(
+                parent.modifiable_orders
+                if parent is not None and modifiable is frozen[parent_id].get("modifiable_orders")
+                else frozenset(modifiable)
+            ),
+        )
+        return built[tenant_id]
+
+    tenants = {tenant_id: build(tenant_id) for tenant_id in raw}
+    if DEFAULT_TENANT_ID not in tenants:
+        raise ValueError(f"No tenant file defines the default tenant '{DEFAULT_TENANT_ID}' (DEFAULT_TENANT)")
+    return MappingProxyType(tenants)
+
+
+def _tenant_files(directory: Path) -> List[Path]:
+    return sorted(p for p in Path(directory).iterdir() if p.suffix in (".json", ".yaml", ".yml"))
+
+
+def load_tenants(directory: Path = TENANTS_DIR) -> Mapping[str, Tenant]:
+    """Load every tenant definition found in a directory.
+
+    Args:
+        directory: Folder containing one ``<tenant_id>.json`` (or ``.yaml``) file per tenant
+
+    Returns:
+        Tenants keyed by their ID
+    """
+    return _build_tenants(_tenant_files(directory))
+
+
+# Reloaded whenever a tenant file is added, removed or modified
+tenant_registry: ReloadableContent[Mapping[str, Tenant]] = ReloadableContent(
+    "tenants", lambda: _tenant_files(TENANTS_DIR), _build_tenants
+)
+
+
+def all_tenants() -> Mapping[str, Tenant]:
+    """Return every configured tenant from the current snapshot."""
+    return tenant_registry.get()
+
+
+def tenant_labels() -> Dict[str, str]:
+    """Unique display label of every tenant, mapped to the tenant's ID.
+
+    Locations that share a name (e.g. tenants that inherit it through
+    "extends") are told apart by their ID: "ABC Restaurant (xyz)".
+    """
+    tenants = all_tenants().values()
+    names = [tenant.name for tenant in tenants]
+    return {
+        tenant.name if names.count(tenant.name) == 1 else f"{tenant.name} ({tenant.tenant_id})": tenant.tenant_id
+        for tenant in tenants
+    }
+
+
+def get_tenant(tenant_id: Optional[str] = None) -> Tenant:
+    """Look up a tenant by ID, falling back to the default tenant.
+
+    Args:
+        tenant_id: The tenant to select, or None for the default
+
+    Returns:
+        The matching tenant configuration
+    """
+    tenants = all_tenants()
+    if tenant_id and tenant_id in tenants:
+        return tenants[tenant_id]
+    return tenants[DEFAULT_TENANT_ID]
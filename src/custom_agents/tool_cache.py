@@ -0,0 +1,152 @@
+import functools
+import inspect
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from agents import RunContextWrapper
+
+from custom_agents.order_store import on_order_change
+
+# Entities whose cached results are invalidated together, e.g. ("abc", "order", "12345")
+EntityKey = Tuple[str, str, str]
+
+
+class ToolCache:
+    """Results of idempotent tool calls shared by all sessions of the process.
+
+    Every cached result remembers the version of the entity it was computed
+    from. Writing to an entity bumps its version, which invalidates the shared
+    entry and every per-session copy at once without having to find them.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple, Tuple[float, int, Any]] = {}
+        self._versions: Dict[EntityKey, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, entity: EntityKey) -> int:
+        return self._versions.get(entity, 0)
+
+    def invalidate(self, tenant_id: str, entity: str, entity_id: str) -> None:
+        """Mark every cached result about an entity as stale."""
+        key = (tenant_id, entity, entity_id)
+        self._versions[key] = self._versions.get(key, 0) + 1
+
+    def clear(self) -> None:
+        """Forget every cached result, entity version and counter."""
+        self._entries.clear()
+        self._versions.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple, entity: Optional[EntityKey]) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires, version, value = entry
+        if expires < time.monotonic() or (entity and version != self.version(entity)):
+            self._entries.pop(key, None)
+            return False, None
+        return True, value
+
+    def put(self, key: Tuple, entity: Optional[EntityKey], value: Any, ttl: float) -> None:
+        if len(self._entries) >= self.max_entries:
+            now = time.monotonic()
+            for stale in [k for k, (expires, _, _) in self._entries.items() if expires < now]:
+                del self._entries[stale]
+            while len(self._entries) >= self.max_entries:
+                # Drop the oldest entry
+                del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + ttl, self.version(entity) if entity else 0, value)
+
+
+tool_cache = ToolCache()
+# Order writes (status changes, update_order) invalidate cached order lookups
+on_order_change(lambda tenant_id, order_id, kind: tool_cache.invalidate(tenant_id, "order", order_id))
+
+
+def idempotent(
+    entity: Optional[str] = None,
+    id_arg: Optional[str] = None,
+    session_ttl: float = 30,
+    shared_ttl: float = 10,
+    only_if: Optional[Callable[[Dict[str, Any]], bool]] = None,
+):
+    """Memoize a read-only tool per session and in the shared `tool_cache`.
+
+    Apply it below `@function_tool`; the wrapped function keeps its signature
+    and docstring, so the tool schema is unchanged.
+
+    Args:
+        entity: Kind of entity the tool reads (e.g. "order"), used for invalidation
+        id_arg: Name of the argument holding the entity ID
+        session_ttl: Seconds a result stays cached in the session
+        shared_ttl: Seconds a result stays cached for all sessions of the tenant
+        only_if: Given the call's arguments, decides whether the call is cacheable
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(ctx: RunContextWrapper, *args, **kwargs):
+            bound = signature.bind(ctx, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(list(bound.arguments.items())[1:])
+            if only_if is not None and not only_if(arguments):
+                return func(ctx, *args, **kwargs)
+
+            tenant_id = ctx.context.tenant_id
+            key = (tenant_id, func.__name__, tuple(sorted(arguments.items())))
+            entity_key = (tenant_id, entity, str(arguments.get(id_arg, ""))) if entity else None
+
+            # Per-session cache first, then the shared cache
+            session_cache = ctx.context.tool_cache
+            cached = session_cache.get(key)
+            if cached is not None:
+                expires, version, value = cached
+                if expires >= time.monotonic() and (not entity_key or version == tool_cache.version(entity_key)):
+                    tool_cache.hits += 1
+                    return value
+                del session_cache[key]
+
+            found, value = tool_cache.get(key, entity_key)
+            if found:
+                tool_cache.hits += 1
+            else:
+                tool_cache.misses += 1
+                value = func(ctx, *args, **kwargs)
+                tool_cache.put(key, entity_key, value, shared_ttl)
+            version = tool_cache.version(entity_key) if entity_key else 0
+            session_cache[key] = (time.monotonic() + session_ttl, version, value)
+            return value
+
+        return wrapper
+    return decorator
+
+
+def dedupe_tool_outputs(items: List[Dict[str, Any]], min_length: int = 80) -> List[Dict[str, Any]]:
+    """Replace tool outputs that repeat an earlier output in the history with a short reference.
+
+    The model has already seen the full text once, so re-sending it on every
+    later turn only adds prompt tokens.
+
+    Args:
+        items: The chat history as returned by `to_input_list()`
+        min_length: Outputs shorter than this are left alone
+
+    Returns:
+        The same list, with repeated outputs replaced
+    """
+    seen: Dict[str, str] = {}
+    for item in items:
+        if not isinstance(item, dict) or item.get("type") != "function_call_output":
+            continue
+        output = item.get("output")
+        if not isinstance(output, str) or len(output) < min_length:
+            continue
+        first = seen.setdefault(output, item.get("call_id", ""))
+        if first != item.get("call_id"):
+            item["output"] = f"(Same result as tool call {first}.)"
+    return items
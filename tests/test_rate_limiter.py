@@ -0,0 +1,81 @@
+import asyncio
+
+from custom_agents.rate_limiter import ModelCallLimiter, ModelTurn, TokenBucket
+
+
+def _limiter(requests_per_minute=6000, hold_after_seconds=10.0):
+    """A limiter whose request bucket starts empty, so every call has to queue."""
+    limiter = ModelCallLimiter(requests_per_minute, tokens_per_minute=10**9, hold_after_seconds=hold_after_seconds)
+    limiter.requests.tokens = 0
+    return limiter
+
+
+async def _admit_all(limiter, calls):
+    """Queue (label, turn) calls in order and return the labels in admission order."""
+    admitted = []
+
+    async def call(label, turn):
+        await limiter.acquire(turn, 10)
+        admitted.append(label)
+
+    await asyncio.gather(*(call(label, turn) for label, turn in calls))
+    return admitted
+
+
+def test_token_bucket_waits_for_refill():
+    bucket = TokenBucket(60)
+    assert bucket.time_until(60) == 0
+    bucket.consume(60)
+    assert 0.9 < bucket.time_until(1) <= 1.0
+
+
+def test_sessions_are_admitted_round_robin():
+    async def run():
+        limiter = _limiter()
+        a, b = ModelTurn("a"), ModelTurn("b")
+        return await _admit_all(limiter, [("a1", a), ("a2", a), ("a3", a), ("b1", b)])
+
+    assert asyncio.run(run()) == ["a1", "b1", "a2", "a3"]
+
+
+def test_in_flight_turns_go_before_new_turns():
+    async def run():
+        limiter = _limiter()
+        in_flight = ModelTurn("c", calls=1)
+        return await _admit_all(limiter, [("a", ModelTurn("a")), ("b", ModelTurn("b")), ("c", in_flight)])
+
+    assert asyncio.run(run()) == ["c", "a", "b"]
+
+
+def test_hold_callback_fires_once_per_turn():
+    async def run():
+        limiter = _limiter(requests_per_minute=600, hold_after_seconds=0.01)
+        holds = []
+
+        async def on_hold():
+            holds.append(True)
+
+        turn = ModelTurn("a", on_hold=on_hold)
+        await limiter.acquire(turn, 10)
+        limiter.requests.tokens = 0
+        await limiter.acquire(turn, 10)
+        return holds, turn, limiter.metrics()
+
+    holds, turn, metrics = asyncio.run(run())
+    assert holds == [True]
+    assert turn.held and turn.calls == 2
+    assert metrics["holds"] == 1 and metrics["admitted"] == 2 and metrics["queue_depth"] == 0
+
+
+def test_cancelled_call_is_not_admitted():
+    async def run():
+        limiter = _limiter()
+        waiting = asyncio.ensure_future(limiter.acquire(ModelTurn("a"), 10))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await limiter.acquire(ModelTurn("b"), 10)
+        return limiter.metrics()
+
+    metrics = asyncio.run(run())
+    assert metrics["admitted"] == 1
+    assert metrics["queue_depth"] == 0
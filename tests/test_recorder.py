@@ -0,0 +1,33 @@
+import pytest
+
+from custom_agents.recorder import anonymize
+
+
+@pytest.mark.parametrize("text", [
+    "Book a table on 2026-11-06 19:00",
+    "Where are orders 12345 67890?",
+    "Table for 4 at 19:30",
+    "I am hungry",
+])
+def test_keeps_what_replay_needs(text):
+    assert anonymize(text) == text
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Call me at 555-123-4567", "Call me at <phone>"),
+    ("+1 (555) 123-4567 please", "<phone> please"),
+    ("my number is 5551234567", "my number is <phone>"),
+    ("on 2026-11-06 19:00, phone 555-0199", "on 2026-11-06 19:00, phone <phone>"),
+    ("Write to jo@example.com", "Write to <email>"),
+])
+def test_masks_contact_details(text, expected):
+    assert anonymize(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("My name is John Smith, table for 2", "My name is <name>, table for 2"),
+    ("my name is john", "my name is <name>"),
+    ("I'm Sarah", "I'm <name>"),
+])
+def test_masks_names(text, expected):
+    assert anonymize(text) == expected
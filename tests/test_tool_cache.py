@@ -0,0 +1,112 @@
+import inspect
+
+import pytest
+from agents import RunContextWrapper
+
+from custom_agents.context import SessionContext
+from custom_agents.order_store import get_order_store, reset_order_stores
+from custom_agents.tool_cache import dedupe_tool_outputs, idempotent, tool_cache
+
+calls = []
+
+
+@idempotent(entity="order", id_arg="order_id")
+def lookup(ctx: RunContextWrapper[SessionContext], order_id: str, verbose: bool = False) -> str:
+    """Look up an order."""
+    calls.append(order_id)
+    return f"order {order_id} v{len(calls)}"
+
+
+@idempotent(only_if=lambda args: args["kind"] == "read")
+def conditional(ctx: RunContextWrapper[SessionContext], kind: str) -> int:
+    calls.append(kind)
+    return len(calls)
+
+
+@idempotent(session_ttl=0, shared_ttl=0)
+def uncached(ctx: RunContextWrapper[SessionContext]) -> int:
+    calls.append("uncached")
+    return len(calls)
+
+
+def _ctx(session_id="s1", tenant_id="abc"):
+    return RunContextWrapper(SessionContext(tenant_id=tenant_id, session_id=session_id))
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    calls.clear()
+    tool_cache.clear()
+    reset_order_stores()
+    yield
+    reset_order_stores()
+
+
+def test_keeps_the_tool_signature():
+    assert list(inspect.signature(lookup).parameters) == ["ctx", "order_id", "verbose"]
+    assert lookup.__doc__ == "Look up an order."
+
+
+def test_memoizes_per_session_and_across_sessions():
+    first = lookup(_ctx("s1"), "12345")
+    assert lookup(_ctx("s1"), order_id="12345", verbose=False) == first
+    assert lookup(_ctx("s2"), "12345") == first
+    assert calls == ["12345"]
+    assert (tool_cache.hits, tool_cache.misses) == (2, 1)
+
+
+def test_keys_on_arguments_and_tenant():
+    lookup(_ctx(), "12345")
+    lookup(_ctx(), "67890")
+    lookup(_ctx(tenant_id="xyz"), "12345")
+    assert calls == ["12345", "67890", "12345"]
+
+
+def test_invalidation_reaches_session_copies():
+    session = _ctx("s1")
+    lookup(session, "12345")
+    lookup(session, "67890")
+    tool_cache.invalidate("abc", "order", "12345")
+    lookup(session, "12345")
+    lookup(session, "67890")
+    assert calls == ["12345", "67890", "12345"]
+
+
+def test_order_store_writes_invalidate():
+    lookup(_ctx(), "12345")
+    get_order_store("abc").update("12345", status="dispatched")
+    lookup(_ctx(), "12345")
+    get_order_store("abc").update_tracking("12345", current_location="Main St")
+    lookup(_ctx(), "12345")
+    assert calls == ["12345", "12345", "12345"]
+
+
+def test_only_if_skips_the_cache():
+    ctx = _ctx()
+    assert conditional(ctx, "read") == conditional(ctx, "read")
+    assert conditional(ctx, "write") != conditional(ctx, "write")
+    assert calls == ["read", "write", "write"]
+
+
+def test_expired_results_are_recomputed():
+    ctx = _ctx()
+    assert uncached(ctx) != uncached(ctx)
+
+
+def _output(call_id, output):
+    return {"type": "function_call_output", "call_id": call_id, "output": output}
+
+
+def test_dedupe_replaces_repeated_outputs():
+    long = "Your order 12345 is being prepared and will be delivered in 20 minutes. Items: Pizza, Bread."
+    items = [
+        {"role": "user", "content": "status?"},
+        _output("call_1", long),
+        _output("call_2", "short"),
+        _output("call_3", long),
+        _output("call_4", "short"),
+    ]
+    dedupe_tool_outputs(items)
+    assert items[1]["output"] == long
+    assert items[3]["output"] == "(Same result as tool call call_1.)"
+    assert items[2]["output"] == items[4]["output"] == "short"